@@ -92,3 +92,11 @@ CRISIS_RESPONSE = """I'm really concerned about what you're sharing. Please reac
 🆘 iCall (Mon-Sat, 8am-10pm): 022-25521111
 
 Your life matters. Professional help is available 24/7."""
+
+# Micro-batching for sentiment/intent scoring across concurrent chats
+# Only helps when one process serves several requests at once (threaded or
+# ASGI servers). With single-threaded workers (e.g. gunicorn sync) every
+# message waits the full window for nothing - leave this off there.
+SCORING_BATCH_ENABLED = config('SCORING_BATCH_ENABLED', default=False, cast=bool)
+SCORING_BATCH_WINDOW_MS = config('SCORING_BATCH_WINDOW_MS', default=3, cast=float)
+SCORING_BATCH_MAX_SIZE = config('SCORING_BATCH_MAX_SIZE', default=32, cast=int)
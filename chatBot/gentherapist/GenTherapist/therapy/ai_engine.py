@@ -5,8 +5,15 @@ Uses rule-based NLP and pattern matching
 from textblob import TextBlob
 import re
 import random
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from django.conf import settings
 
+from .batching import MicroBatcher
+
+# Extra time (seconds) beyond the batch window to wait for a batched score
+BATCH_RESULT_GRACE = 1.0
+
 
 class OfflineAIEngine:
     """Rule-based conversational AI for therapy chatbot"""
@@ -124,22 +131,33 @@ class OfflineAIEngine:
                 "Have you considered making a priority list? Not everything needs to be done today."
             ]
         }
+        
+        # Micro-batcher for sentiment/intent scoring (created on first use)
+        self._batcher = None
+        self._batcher_lock = threading.Lock()
+    
+    def _label_polarity(self, polarity):
+        """Map a TextBlob polarity score to a sentiment label"""
+        if polarity > 0.1:
+            return 'positive'
+        elif polarity < -0.1:
+            return 'negative'
+        else:
+            return 'neutral'
     
     def analyze_sentiment(self, text):
         """Analyze sentiment using TextBlob"""
         try:
             blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            
-            if polarity > 0.1:
-                return 'positive'
-            elif polarity < -0.1:
-                return 'negative'
-            else:
-                return 'neutral'
+            return self._label_polarity(blob.sentiment.polarity)
         except:
             return 'neutral'
     
+    def analyze_sentiment_batch(self, texts):
+        """Analyze sentiment for a list of texts, scoring each distinct text once"""
+        labels = {text: self.analyze_sentiment(text) for text in set(texts)}
+        return [labels[text] for text in texts]
+    
     def detect_intent(self, text):
         """Detect user intent from keywords"""
         text_lower = text.lower()
@@ -150,6 +168,54 @@ class OfflineAIEngine:
         
         return 'general'
     
+    def detect_intent_batch(self, texts):
+        """Detect intent for a list of texts in one pass per intent"""
+        lowered = [text.lower() for text in texts]
+        intents = ['general'] * len(texts)
+        pending = set(range(len(texts)))
+        
+        # Same precedence as detect_intent: first matching intent wins
+        for intent, data in self.intent_patterns.items():
+            if not pending:
+                break
+            matched = {i for i in pending
+                       if any(keyword in lowered[i] for keyword in data['keywords'])}
+            for i in matched:
+                intents[i] = intent
+            pending -= matched
+        
+        return intents
+    
+    def score_batch(self, texts):
+        """Return (sentiment, intent) pairs for a list of texts"""
+        sentiments = self.analyze_sentiment_batch(texts)
+        intents = self.detect_intent_batch(texts)
+        return list(zip(sentiments, intents))
+    
+    def _get_batcher(self):
+        """Create the shared micro-batcher from settings on first use"""
+        with self._batcher_lock:
+            if self._batcher is None:
+                self._batcher = MicroBatcher(
+                    self.score_batch,
+                    max_wait=settings.SCORING_BATCH_WINDOW_MS / 1000,
+                    max_batch_size=settings.SCORING_BATCH_MAX_SIZE,
+                )
+            return self._batcher
+    
+    def score_message(self, text, immediate=False):
+        """Return (sentiment, intent) for a message, micro-batched if enabled"""
+        # Immediate messages (e.g. crisis) never wait for a batch window
+        if immediate or not settings.SCORING_BATCH_ENABLED:
+            return self.analyze_sentiment(text), self.detect_intent(text)
+        
+        batcher = self._get_batcher()
+        try:
+            return batcher.submit(text).result(timeout=batcher.max_wait + BATCH_RESULT_GRACE)
+        except FutureTimeoutError:
+            # Batcher stalled - score directly rather than hang the request
+            return self.analyze_sentiment(text), self.detect_intent(text)
+    
     def detect_crisis(self, text):
         """Detect crisis keywords"""
         text_lower = text.lower()
@@ -167,22 +233,25 @@ class OfflineAIEngine:
         keywords = [w for w in words if w not in stop_words and len(w) > 3]
         return keywords[:5]
     
-    def generate_response(self, user_message, conversation_history=None):
+    def generate_response(self, user_message, conversation_history=None,
+                          intent=None, sentiment=None):
         """Generate response using rule-based logic"""
         
         # Check for crisis first
         if self.detect_crisis(user_message):
             return settings.CRISIS_RESPONSE
         
-        # Detect intent
-        intent = self.detect_intent(user_message)
+        # Detect intent (unless already scored by the caller)
+        if intent is None:
+            intent = self.detect_intent(user_message)
         
         # Handle special intents
         if intent in ['greeting', 'gratitude', 'goodbye']:
             return random.choice(self.intent_patterns[intent]['responses'])
         
-        # Get sentiment
-        sentiment = self.analyze_sentiment(user_message)
+        # Get sentiment (unless already scored by the caller)
+        if sentiment is None:
+            sentiment = self.analyze_sentiment(user_message)
         
         # Extract keywords
         keywords = self.extract_keywords(user_message)
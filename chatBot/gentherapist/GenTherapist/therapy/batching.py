@@ -0,0 +1,77 @@
+"""
+Micro-batching for message scoring
+Collects messages from concurrent requests and scores them together
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+
+class MicroBatcher:
+    """Groups items submitted from many threads into small batches"""
+
+    def __init__(self, batch_fn, max_wait=0.003, max_batch_size=32):
+        # batch_fn takes a list of items and returns a list of results
+        self.batch_fn = batch_fn
+        self.max_wait = max_wait
+        self.max_batch_size = max_batch_size
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def submit(self, item):
+        """Queue an item and return a Future for its result"""
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((item, future))
+        return future
+
+    def _ensure_worker(self):
+        """Start the background worker on first use"""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name='micro-batcher', daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self):
+        """Block for one item, then gather more until the window closes"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop - score each batch and resolve the waiting futures"""
+        while True:
+            batch = self._collect()
+            try:
+                self._score(batch)
+            except Exception as e:
+                # Never leave a caller waiting on an unresolved future
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _score(self, batch):
+        """Run batch_fn over one batch and hand each caller its result"""
+        results = list(self.batch_fn([item for item, _ in batch]))
+        if len(results) != len(batch):
+            raise ValueError(
+                f'batch_fn returned {len(results)} results for {len(batch)} items'
+            )
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
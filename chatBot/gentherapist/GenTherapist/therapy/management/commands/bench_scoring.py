@@ -0,0 +1,95 @@
+"""
+Benchmark sentiment/intent scoring with and without micro-batching
+Usage: python manage.py bench_scoring --concurrency 1 8 32 --messages 2000
+
+Messages are made unique by default, since real chat messages rarely repeat
+and the batch path scores each distinct text only once. Pass --repeated to
+cycle through the fixed samples instead.
+"""
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from therapy.ai_engine import ai_engine
+from therapy.batching import MicroBatcher
+
+
+SAMPLE_MESSAGES = [
+    "I'm feeling anxious about my exam tomorrow",
+    "Hello there",
+    "I've been so stressed with work lately",
+    "I feel empty and lonely most days",
+    "Thanks, that really helped!",
+    "I can't sleep and I'm exhausted",
+    "I'm feeling great today!",
+    "My family keeps arguing and I don't know what to do",
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare scoring throughput and p99 latency with and without micro-batching'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 64])
+        parser.add_argument('--messages', type=int, default=2000)
+        parser.add_argument('--window-ms', type=float, default=3)
+        parser.add_argument('--max-batch-size', type=int, default=32)
+        parser.add_argument('--repeated', action='store_true',
+                            help='Reuse the fixed sample texts instead of unique messages')
+
+    def handle(self, *args, **options):
+        batcher = MicroBatcher(
+            ai_engine.score_batch,
+            max_wait=options['window_ms'] / 1000,
+            max_batch_size=options['max_batch_size'],
+        )
+        modes = {
+            'direct': lambda text: (ai_engine.analyze_sentiment(text), ai_engine.detect_intent(text)),
+            'batched': lambda text: batcher.submit(text).result(),
+        }
+
+        # Warm up TextBlob and the batcher thread
+        for score in modes.values():
+            score(SAMPLE_MESSAGES[0])
+
+        self.stdout.write(f"{'mode':<8} {'threads':>7} {'msg/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+        for concurrency in options['concurrency']:
+            for name, score in modes.items():
+                throughput, p50, p99 = self._run(
+                    score, concurrency, options['messages'], options['repeated']
+                )
+                self.stdout.write(
+                    f"{name:<8} {concurrency:>7} {throughput:>10.0f} {p50:>8.2f} {p99:>8.2f}"
+                )
+
+    def _run(self, score, concurrency, total, repeated=False):
+        """Score `total` messages split across `concurrency` threads"""
+        latencies = []
+        lock = threading.Lock()
+        per_thread = max(1, total // concurrency)
+
+        def worker(offset):
+            local = []
+            for i in range(per_thread):
+                text = SAMPLE_MESSAGES[(offset + i) % len(SAMPLE_MESSAGES)]
+                if not repeated:
+                    text = f"{text} (#{offset}-{i})"
+                start = time.perf_counter()
+                score(text)
+                local.append((time.perf_counter() - start) * 1000)
+            with lock:
+                latencies.extend(local)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        return len(latencies) / elapsed, statistics.median(latencies), p99
@@ -1,3 +1,118 @@
-from django.test import TestCase
+import json
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .ai_engine import ai_engine
+from .batching import MicroBatcher
+
+
+class MicroBatcherTests(TestCase):
+    """Tests for the scoring micro-batcher"""
+
+    def test_concurrent_submits_get_their_own_results(self):
+        batcher = MicroBatcher(lambda items: [item * 10 for item in items], max_wait=0.005)
+        results = {}
+
+        def worker(n):
+            results[n] = [batcher.submit(n * 100 + i).result(timeout=5) for i in range(10)]
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for n in range(8):
+            self.assertEqual(results[n], [(n * 100 + i) * 10 for i in range(10)])
+
+    def test_batch_fn_exception_reaches_every_future(self):
+        def fail(items):
+            raise ValueError('scoring failed')
+
+        batcher = MicroBatcher(fail, max_wait=0.05)
+        futures = [batcher.submit(i) for i in range(3)]
+
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+
+    def test_short_results_fail_every_future(self):
+        batcher = MicroBatcher(lambda items: items[:-1], max_wait=0.05)
+        futures = [batcher.submit(i) for i in range(3)]
+
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+
+    def test_max_batch_size_splits_batch(self):
+        sizes = []
+
+        def record(items):
+            sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(record, max_wait=0.2, max_batch_size=2)
+        futures = [batcher.submit(i) for i in range(5)]
+
+        self.assertEqual([future.result(timeout=5) for future in futures], [0, 1, 2, 3, 4])
+        self.assertEqual(sizes, [2, 2, 1])
+
+
+class BatchScoringTests(TestCase):
+    """Tests for the batch scoring paths of the AI engine"""
+
+    def test_detect_intent_batch_matches_detect_intent(self):
+        texts = [
+            "Hi, I'm anxious and stressed",
+            "I feel sad and overwhelmed, thanks for listening",
+            "hello, bye",
+            "I'm so stressed I can't sleep, goodbye",
+            "Nothing much going on",
+            "",
+        ]
+        self.assertEqual(
+            ai_engine.detect_intent_batch(texts),
+            [ai_engine.detect_intent(text) for text in texts],
+        )
+
+    def test_score_batch_matches_direct_scoring(self):
+        texts = ["I'm feeling great today!", "I feel empty and lonely", "I'm feeling great today!"]
+        self.assertEqual(
+            ai_engine.score_batch(texts),
+            [(ai_engine.analyze_sentiment(t), ai_engine.detect_intent(t)) for t in texts],
+        )
+
+
+@override_settings(SCORING_BATCH_ENABLED=True)
+class SendMessageBatchingTests(TestCase):
+    """Tests for send_message with micro-batching enabled"""
+
+    def post_message(self, message):
+        return self.client.post(
+            reverse('send-message'),
+            data=json.dumps({'message': message}),
+            content_type='application/json',
+        )
+
+    def test_crisis_message_skips_batcher(self):
+        with mock.patch.object(ai_engine, '_get_batcher') as get_batcher:
+            response = self.post_message("I want to hurt myself")
+
+        get_batcher.assert_not_called()
+        data = response.json()
+        self.assertTrue(data['is_crisis'])
+        self.assertEqual(data['bot_response'], settings.CRISIS_RESPONSE)
+
+    def test_regular_message_uses_batcher(self):
+        batcher = MicroBatcher(ai_engine.score_batch, max_wait=0.001)
+        with mock.patch.object(ai_engine, '_get_batcher', return_value=batcher) as get_batcher:
+            response = self.post_message("I'm feeling anxious about my exam")
+
+        get_batcher.assert_called_once()
+        data = response.json()
+        self.assertFalse(data['is_crisis'])
+        self.assertEqual(data['intent'], 'anxiety')
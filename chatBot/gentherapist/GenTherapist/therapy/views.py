@@ -32,15 +32,12 @@ def send_message(request):
         # Get conversation history
         conversation = request.session.get('conversation', [])
         
-        # Analyze sentiment
-        sentiment = ai_engine.analyze_sentiment(user_message)
-        
-        # Detect intent
-        intent = ai_engine.detect_intent(user_message)
-        
-        # Check for crisis
+        # Check for crisis (always on the immediate path)
         is_crisis = ai_engine.detect_crisis(user_message)
         
+        # Analyze sentiment and detect intent (micro-batched if enabled)
+        sentiment, intent = ai_engine.score_message(user_message, immediate=is_crisis)
+        
         # Save user message
         conversation.append({
             'role': 'user',
@@ -49,7 +46,9 @@ def send_message(request):
         })
         
         # Generate AI response
-        bot_response = ai_engine.generate_response(user_message, conversation)
+        bot_response = ai_engine.generate_response(
+            user_message, conversation, intent=intent, sentiment=sentiment
+        )
         
         # Save bot response
         conversation.append({